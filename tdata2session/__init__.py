@@ -0,0 +1,16 @@
+"""Converts Telegram Desktop tdata folders into Telethon session files."""
+
+
+def run(directory, output='output', concurrency: int = 32):
+    """
+    Converts every tdata folder under ``directory`` to a Telethon session.
+
+    Imported lazily so ``python -m tdata2session`` does not load the
+    implementation module twice.
+
+    :param directory: Directory containing one or multiple tdata folders.
+    :param output: Directory where session files will be saved.
+    :param concurrency: Maximum number of tdata folders processed at once.
+    """
+    from tdata2session.__main__ import run as _run
+    return _run(directory, output, concurrency)
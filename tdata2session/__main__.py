@@ -0,0 +1,342 @@
+import sys
+import asyncio
+import argparse
+import functools
+import logging
+import logging.handlers
+import os
+import queue
+from pathlib import Path
+from typing import Optional
+
+from opentele.td import TDesktop
+from opentele.api import UseCurrentSession
+from telethon import TelegramClient
+from telethon.errors import SessionPasswordNeededError
+
+# Configure the event loop policy to avoid issues with ProactorEventLoop on Windows
+if sys.platform.startswith('win'):
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+else:
+    # Use uvloop when available; its libuv-based loop handles many concurrent
+    # Telethon sockets with far less overhead than the default selector loop.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+# Configure the logger
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Moves log writing off the event-loop thread.
+
+    The stock StreamHandler does a locked write() + flush() per record, which
+    blocks the asyncio loop on every log line during batch runs. Swap the root
+    handlers for a QueueHandler so the loop only enqueues records, and let a
+    QueueListener thread do the actual writes.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+@functools.lru_cache(maxsize=4096)
+def _stat(path: str) -> Optional[os.stat_result]:
+    """
+    Stats a path once and caches the result, including negative lookups.
+
+    The same directories are checked repeatedly across a batch run; caching
+    saves a statx syscall per repeat. The cache is cleared at the start of
+    each invocation and after session files are written, since results can go
+    stale once the filesystem changes.
+    """
+    try:
+        return os.stat(path, follow_symlinks=False)
+    except OSError:
+        return None
+
+
+def _exists(path: Path) -> bool:
+    return _stat(str(path)) is not None
+
+
+def _load_tdesktop(tdata_folder: Path) -> Optional[TDesktop]:
+    tdata_str = os.fspath(tdata_folder)
+    logging.debug("Loading TDesktop client from folder: %s", tdata_str)
+
+    try:
+        tdesktop_client = TDesktop(tdata_str)
+        if not tdesktop_client.isLoaded():
+            logging.warning("No accounts loaded. Please check the tdata folder.")
+            return None
+
+        logging.debug("TDesktop client loaded successfully. Accounts loaded: %d", len(tdesktop_client.accounts))
+        return tdesktop_client
+
+    except Exception as e:
+        logging.error("Error loading TDesktop client: %s", e, exc_info=True)
+        return None
+
+
+async def load_tdesktop_client(tdata_folder: Path, load_semaphore: asyncio.Semaphore) -> Optional[TDesktop]:
+    """
+    Loads the TDesktop client from the tdata folder.
+
+    The TDesktop constructor reads the tdata files synchronously, so the load
+    runs on the thread pool to keep the event loop free, with a semaphore
+    bounding how many folders load at once.
+
+    :param tdata_folder: Path to the tdata folder.
+    :param load_semaphore: Limits the number of concurrent disk loads.
+    :return: Loaded TDesktop client or None if failed.
+    """
+    async with load_semaphore:
+        return await asyncio.to_thread(_load_tdesktop, tdata_folder)
+
+
+def _tune_session_db(client: TelegramClient) -> None:
+    """
+    Relaxes SQLite durability on the Telethon session database.
+
+    Telethon's default session opens SQLite with rollback journaling and
+    synchronous=FULL, paying several fsyncs per state flush. WAL with
+    synchronous=NORMAL groups the writes and skips the per-commit fsync,
+    which adds up across a batch of thousands of conversions. Trade-off: a
+    crash at the wrong moment may lose the last commit, which for a freshly
+    converted session just means re-running the conversion. Degrades to a
+    no-op if Telethon's session internals change.
+    """
+    try:
+        client.session._conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;"
+        )
+    except AttributeError:
+        pass
+
+
+async def convert_to_telethon_session(tdesktop_client: TDesktop, session_file: Path) -> Optional[TelegramClient]:
+    """
+    Converts the TDesktop session to a Telethon session using the current session.
+
+    :param tdesktop_client: Loaded TDesktop client.
+    :param session_file: Path to save the Telethon session file.
+    :return: Initialized Telethon client or None if failed.
+    """
+    try:
+        logging.debug("Converting TDesktop session to Telethon session using the current session...")
+
+        client = await tdesktop_client.ToTelethon(
+            session=os.fspath(session_file),
+            flag=UseCurrentSession
+        )
+
+        _tune_session_db(client)
+
+        # ToTelethon may hand back an already-connected client; reconnecting
+        # would pay the full transport handshake a second time.
+        if not client.is_connected():
+            await client.connect()
+
+        if not await client.is_user_authorized():
+            logging.warning("Client is not authorized.")
+            return None
+
+        logging.debug("Session file saved successfully: %s", session_file)
+        _stat.cache_clear()
+        return client
+
+    except SessionPasswordNeededError:
+        logging.error("Two-factor authentication is enabled. Please disable it and try again.")
+        return None
+
+    except Exception as e:
+        logging.error("Error converting to Telethon session: %s", e, exc_info=True)
+        return None
+
+
+def claim_session_file(session_path: Path) -> bool:
+    """
+    Atomically claims the session file, detecting duplicates in the same step.
+
+    Creates the file with O_CREAT | O_EXCL so a single open both checks for an
+    existing session and reserves the name, avoiding a separate exists() check
+    and the race between checking and writing. SQLite treats the empty file as
+    a new database when Telethon saves the session.
+
+    The caller owns the claim: if processing fails before a real session is
+    written, it must unlink the file so the identifier can be retried on the
+    next run and no empty .session file is left looking like valid output.
+
+    :param session_path: Path to the session file.
+    :return: True if the file was claimed, False if it already exists.
+    """
+    try:
+        fd = os.open(session_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        logging.warning("Session file already exists: %s", session_path)
+        return False
+    os.close(fd)
+    return True
+
+
+async def process_tdata_folder(tdata_folder: Path, identifier: str, output_directory: Path,
+                               semaphore: asyncio.Semaphore, load_semaphore: asyncio.Semaphore):
+    """
+    Processes a single tdata folder and performs the conversion to Telethon.
+
+    The semaphore bounds how many folders are processed at once; without it a
+    large batch would open every Telethon client simultaneously and exhaust
+    sockets and file descriptors.
+
+    :param tdata_folder: Path to the tdata folder.
+    :param identifier: Name or number associated with the session.
+    :param output_directory: Directory where session files will be saved.
+    :param semaphore: Limits the number of concurrently processed folders.
+    :param load_semaphore: Limits the number of concurrent disk loads.
+    """
+    async with semaphore:
+        await _process_tdata_folder(tdata_folder, identifier, output_directory, load_semaphore)
+
+
+async def _process_tdata_folder(tdata_folder: Path, identifier: str, output_directory: Path,
+                                load_semaphore: asyncio.Semaphore):
+    session_file = output_directory / f"{identifier}.session"
+
+    if not claim_session_file(session_file):
+        logging.info("Session file '%s' already exists. Please check and remove if necessary.", session_file)
+        return
+
+    client = None
+    completed = False
+    try:
+        tdesktop_client = await load_tdesktop_client(tdata_folder, load_semaphore)
+        if tdesktop_client is None:
+            logging.error("Failed to load TDesktop client. Please check the tdata folder and try again.")
+            return
+
+        client = await convert_to_telethon_session(tdesktop_client, session_file)
+        if client is None:
+            logging.error("Failed to convert to Telethon session.")
+            return
+
+        # One structured record per identifier; the step-by-step messages are
+        # at DEBUG so default INFO runs emit a single line per folder.
+        me = await client.get_me()
+        stats = {
+            'identifier': identifier,
+            'accounts': len(tdesktop_client.accounts),
+            'user_id': me.id if me else None,
+            'session_bytes': session_file.stat().st_size,
+        }
+        logging.info("Completed: %s", stats)
+        completed = True
+
+    finally:
+        if client:
+            await client.disconnect()
+        if not completed:
+            # Release the claim so a transient failure does not permanently
+            # block retries or leave an empty .session behind.
+            session_file.unlink(missing_ok=True)
+
+
+# Built once at import so repeated parse_args calls reuse the same parser.
+_PARSER = argparse.ArgumentParser(description='Convert TDesktop sessions to Telethon sessions.')
+_PARSER.add_argument('directory', type=Path, help='Directory containing one or multiple tdata folders.')
+_PARSER.add_argument('--output', type=Path, help='Directory where session files will be saved.',
+                     default=Path('output'))
+_PARSER.add_argument('--concurrency', type=int, default=32,
+                     help='Maximum number of tdata folders processed at once.')
+
+
+async def main():
+    args = _PARSER.parse_args()
+    await _main(args.directory, args.output, args.concurrency)
+
+
+def run(directory, output='output', concurrency: int = 32):
+    """
+    Library entry point: converts the given directory without the CLI.
+
+    Lets callers drive batches from Python instead of re-spawning the
+    interpreter per directory in a shell loop.
+
+    :param directory: Directory containing one or multiple tdata folders.
+    :param output: Directory where session files will be saved.
+    :param concurrency: Maximum number of tdata folders processed at once.
+    """
+    asyncio.run(_main(Path(directory), Path(output), concurrency))
+
+
+async def _main(base_directory: Path, output_directory: Path, concurrency: int = 32):
+    # Start from fresh filesystem state; cached lookups from a previous run()
+    # call in the same interpreter may be stale.
+    _stat.cache_clear()
+
+    if not _exists(base_directory):
+        logging.error("The specified directory does not exist: %s", base_directory)
+        sys.exit(1)
+
+    # Created exactly once here, before any task spawns; per-task code relies
+    # on it existing and never re-creates it.
+    output_directory.mkdir(parents=True, exist_ok=True)
+    assert _exists(output_directory), f"output directory was not created: {output_directory}"
+    logging.info("Output directory is set to: %s", output_directory)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    # Bounds how many TDesktop loads run concurrently on the thread pool.
+    # Created per invocation so it binds to the current event loop.
+    load_semaphore = asyncio.Semaphore(min(8, os.cpu_count() or 1))
+    tasks = []
+
+    # Check if it's a single tdata folder or a directory containing multiple tdata folders
+    if _exists(base_directory / "tdata"):
+        # Single tdata folder
+        identifier = base_directory.name
+        tasks.append(process_tdata_folder(base_directory / "tdata", identifier, output_directory,
+                                          semaphore, load_semaphore))
+    else:
+        # Directory containing multiple tdata folders
+        with os.scandir(base_directory) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                # A single stat both tests existence and returns the file type,
+                # instead of a separate exists() check per candidate.
+                try:
+                    os.stat(os.path.join(entry.path, "tdata"), follow_symlinks=False)
+                except OSError:
+                    continue
+                tdata_folder = Path(entry.path) / "tdata"
+                tasks.append(process_tdata_folder(tdata_folder, entry.name, output_directory,
+                                                  semaphore, load_semaphore))
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    else:
+        logging.warning("No tdata folders found in the specified directory.")
+
+
+def entrypoint():
+    """Console entry point: runs the converter with background log writing."""
+    listener = _start_log_listener()
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        logging.error("Fatal error: %s", e, exc_info=True)
+    finally:
+        listener.stop()
+
+
+if __name__ == "__main__":
+    entrypoint()